@@ -6,11 +6,21 @@ A tool for extracting, analyzing, and modifying Electron applications
 
 import os
 import sys
+import asyncio
+import threading
+import queue
 import subprocess
+import signal
 import shutil
 import json
+import hashlib
+import glob
+import struct
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Set, Dict, Callable
+from typing import Optional, List, Set, Dict, Callable, Iterator, Union, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 import tkinter as tk
@@ -19,11 +29,38 @@ import platform
 import tempfile
 import re
 
+# Platform detection, evaluated once at import
+_IS_WINDOWS = platform.system() == 'Windows'
+_IS_DARWIN = platform.system() == 'Darwin'
+
 # Platform-specific imports
-if platform.system() == 'Windows':
+if _IS_WINDOWS:
     import winreg
     import ctypes
 
+# Optional streaming JSON parser for large source maps
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Maximum number of lines kept in the console widget
+_CONSOLE_MAX_LINES = 5000
+
+# Maximum number of queued log messages written per console refresh
+_LOG_BATCH_SIZE = 200
+
+# Maximum number of characters of a failed command's stderr that is reported
+_STDERR_LIMIT = 4000
+
+# Seconds an asar extract or pack may run before it is killed (large apps
+# ship archives of several hundred MB)
+_ASAR_TIMEOUT = 900
+
+# Maximum number of source map summaries kept in memory and in script_dir/.cache
+_SOURCE_MAP_CACHE_SIZE = 256
+
 
 class Theme(Enum):
     """Color theme constants"""
@@ -39,6 +76,97 @@ class Theme(Enum):
     SUCCESS = '#4aff4a'
 
 
+# Plain lookup of theme colors by name, avoiding Enum attribute access
+_TH: Dict[str, str] = {name: member.value for name, member in Theme.__members__.items()}
+
+
+# Text of the Help > Instructions window
+_INSTRUCTIONS = """
+╔══════════════════════════════════════════════════════════╗
+║        Electron Application Decompiler v2.0              ║
+║        Compatible with Python 3.13.7                     ║
+╚══════════════════════════════════════════════════════════╝
+
+📋 PREREQUISITES
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+1. Install Node.js from https://nodejs.org/
+2. Run as Administrator (Windows) or with sudo (Linux/Mac)
+3. Click "Install Required Tools" before first use
+
+📖 STEP-BY-STEP GUIDE
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+1. APPLICATION SELECTION
+   • Click "Browse" to select your Electron .exe file
+   • Output directory will be created automatically
+
+2. TOOLS INSTALLATION
+   • Click "Install Required Tools"
+   • Wait for npm packages to install
+   • Check console for success messages
+
+3. EXTRACTION
+   • Click "Extract ASAR Archive"
+   • Files will be extracted to: [app_name]/
+   • Directory will open automatically
+
+4. ANALYSIS
+   • "Analyze Source Maps" - View available source maps
+   • "Setup Development Tools" - Get DevTools instructions
+
+5. MODIFICATION
+   • Click "Edit Extracted Files" to open the directory
+   • Modify files using your preferred text editor
+   
+   Common files to edit:
+   ├── main.js          → Main process code
+   ├── renderer.js      → Renderer process code
+   ├── index.html       → Application UI
+   └── package.json     → App configuration
+
+6. RECOMPILATION
+   • Click "Recompile & Apply Changes"
+   • Backup created automatically (.asar.backup)
+   • Original file will be replaced
+
+🔧 TROUBLESHOOTING
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+• npm not found → Install Node.js and restart
+• Extraction fails → Check app directory structure
+• Recompile fails → Run as administrator
+• Console shows detailed error messages
+
+⚠️ IMPORTANT NOTES
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+• Always backup before modifying applications
+• Some apps may have additional protection
+• Modifications might break functionality
+• Use for educational purposes only
+
+💡 TIPS
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+• Use a good code editor (VS Code, Sublime Text)
+• Test modifications in a safe environment
+• Keep backups of working versions
+• Check console output for detailed information
+"""
+
+# Text of the Help > About dialog
+_ABOUT_TEXT = (
+    "Electron Application Decompiler\n\n"
+    "Version: 2.0\n"
+    "Python: 3.13.7 Compatible\n\n"
+    "A tool for extracting, analyzing, and modifying\n"
+    "Electron-based applications.\n\n"
+    "Features:\n"
+    "• ASAR extraction and packing\n"
+    "• Source map analysis\n"
+    "• File modification support\n"
+    "• Automatic backup creation\n\n"
+    "Use responsibly and ethically."
+)
+
+
 @dataclass
 class AppConfig:
     """Application configuration"""
@@ -46,11 +174,15 @@ class AppConfig:
     app_path: Optional[Path] = None
     output_dir: Optional[Path] = None
     npm_path: Optional[Path] = None
+    node_path: Optional[Path] = None
+    asar_cli: Optional[Path] = None
+    incremental_repack: bool = True
 
 
+@lru_cache(maxsize=None)
 def is_admin() -> bool:
     """Check if running with administrator privileges (Windows only)"""
-    if platform.system() != 'Windows':
+    if not _IS_WINDOWS:
         return True  # Assume sufficient privileges on non-Windows
     try:
         return ctypes.windll.shell32.IsUserAnAdmin()
@@ -58,6 +190,408 @@ def is_admin() -> bool:
         return False
 
 
+def _win_move(src: Path, dst: Path) -> None:
+    """Move src over dst with MoveFileExW, flushing before returning (Windows only)"""
+    MOVEFILE_REPLACE_EXISTING = 0x1
+    MOVEFILE_WRITE_THROUGH = 0x8
+    
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    move_file = kernel32.MoveFileExW
+    move_file.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_uint32]
+    move_file.restype = ctypes.c_int
+    
+    if not move_file(str(src), str(dst), MOVEFILE_REPLACE_EXISTING | MOVEFILE_WRITE_THROUGH):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def _open_dir(path: Path) -> None:
+    """
+    Open a directory in the platform file manager
+    
+    subprocess.run waits for the opener to exit, and shell extensions or
+    desktop portals can hold it for seconds, so call this off the UI thread.
+    """
+    if _IS_WINDOWS:
+        os.startfile(path)
+    elif _IS_DARWIN:
+        subprocess.run(['open', str(path)])
+    else:
+        subprocess.run(['xdg-open', str(path)])
+
+
+def _kill_tree(proc: Union[subprocess.Popen, asyncio.subprocess.Process]) -> None:
+    """Kill a child process together with any processes it started"""
+    if _IS_WINDOWS:
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(proc.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return
+    
+    # Children are started in their own session, so the pid is the group id
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _run_quiet(cmd: List[str], timeout: float = _ASAR_TIMEOUT) -> Tuple[int, str]:
+    """
+    Run a command, discarding stdout and decoding stderr only on failure
+    
+    The command runs in a session of its own so that a timeout also kills
+    anything it started (node under `npm exec`), which would otherwise keep
+    stderr open.
+    
+    Returns:
+        The exit code and the tail of stderr (empty on success), or -1 and
+        a message if the command was killed after timeout seconds
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            start_new_session=True)
+    try:
+        _, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_tree(proc)
+        try:
+            proc.communicate(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        return -1, f"timed out after {timeout} seconds"
+    
+    if proc.returncode == 0:
+        return 0, ''
+    return proc.returncode, stderr[-_STDERR_LIMIT:].decode(errors='replace')
+
+
+def _walk_entries(root: Union[str, Path], suffix: Optional[str] = None,
+                  dir_mtimes: Optional[Dict[str, int]] = None) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield the non-directory entries below root using os.scandir
+    
+    DirEntry caches the file type reported by the directory listing, so
+    unlike Path.rglob no extra stat() call is made per entry. Symlinks are
+    yielded as entries and never followed.
+    
+    Args:
+        root: Directory to walk
+        suffix: Only yield files whose name ends with this suffix
+        dir_mtimes: If given, filled with the mtime_ns of every directory walked
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            if dir_mtimes is not None:
+                # Taken before listing so a concurrent change is never missed
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif suffix is None or entry.name.endswith(suffix):
+                        yield entry
+        except OSError:
+            continue
+
+
+def _walk(root: Union[str, Path], suffix: Optional[str] = None) -> Iterator[str]:
+    """Recursively yield file paths below root (see _walk_entries)"""
+    return (entry.path for entry in _walk_entries(root, suffix))
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy a file, letting the kernel clone the data where supported
+    
+    os.copy_file_range shares extents on btrfs/XFS and copies server-side
+    on NFS; shutil.copy2 is used when it is unavailable or fails.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    
+    shutil.copy2(src, dst)
+
+
+def _newest_first(paths: Iterator[str]) -> List[str]:
+    """Sort paths by the last x.y.z version they contain, newest first"""
+    def version(path: str) -> Tuple[int, ...]:
+        matches = re.findall(r'(\d+)\.(\d+)\.(\d+)', path)
+        return tuple(map(int, matches[-1])) if matches else ()
+    
+    return sorted(paths, key=version, reverse=True)
+
+
+def _find_suffix(directory: Path, suffix: str) -> List[Path]:
+    """List the non-directory entries of directory whose name ends with suffix"""
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(entry.path) for entry in entries
+                    if not entry.is_dir(follow_symlinks=False) and entry.name.endswith(suffix)]
+    except FileNotFoundError:
+        return []
+
+
+def _snapshot_tree(root: Path) -> Dict[str, Tuple[int, int]]:
+    """
+    Map each file below root (as a relative POSIX path) to (size, mtime_ns)
+    
+    Symlinks are recorded by their own lstat, so links archived in the ASAR
+    (including dangling ones) do not break the snapshot.
+    """
+    snapshot: Dict[str, Tuple[int, int]] = {}
+    for entry in _walk_entries(root):
+        try:
+            stat = entry.stat(follow_symlinks=False)
+        except FileNotFoundError:
+            continue  # Removed while walking
+        snapshot[Path(os.path.relpath(entry.path, root)).as_posix()] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def _read_asar_header(path: Path) -> Tuple[Dict[str, Any], int]:
+    """
+    Read the JSON header of an ASAR archive
+    
+    Returns:
+        The parsed header and the offset at which file data starts
+    """
+    with open(path, 'rb') as f:
+        size_pickle = f.read(8)
+        if len(size_pickle) != 8:
+            raise ValueError(f"{path.name} is not an ASAR archive")
+        header_size = struct.unpack_from('<I', size_pickle, 4)[0]
+        header_pickle = f.read(header_size)
+        json_size = struct.unpack_from('<I', header_pickle, 4)[0]
+        header = json.loads(header_pickle[8:8 + json_size].decode('utf-8'))
+    return header, 8 + header_size
+
+
+def _encode_asar_header(header: Dict[str, Any]) -> bytes:
+    """Serialize an ASAR header into its Chromium pickle framing"""
+    data = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    payload = struct.pack('<I', len(data)) + data + b'\0' * (-len(data) % 4)
+    header_pickle = struct.pack('<I', len(payload)) + payload
+    return struct.pack('<II', 4, len(header_pickle)) + header_pickle
+
+
+def _iter_asar_files(node: Dict[str, Any], prefix: str = '') -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (relative POSIX path, entry) for every file in an ASAR header"""
+    for name, entry in node.get('files', {}).items():
+        path = f"{prefix}{name}"
+        if 'files' in entry:
+            yield from _iter_asar_files(entry, f"{path}/")
+        elif 'link' not in entry:
+            yield path, entry
+
+
+def _asar_integrity(path: Path, block_size: int) -> Dict[str, Any]:
+    """Compute the SHA256 integrity record asar stores for a file"""
+    file_hash = hashlib.sha256()
+    blocks: List[str] = []
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            file_hash.update(block)
+            blocks.append(hashlib.sha256(block).hexdigest())
+    if not blocks:
+        blocks.append(hashlib.sha256(b'').hexdigest())
+    return {
+        'algorithm': 'SHA256',
+        'hash': file_hash.hexdigest(),
+        'blockSize': block_size,
+        'blocks': blocks,
+    }
+
+
+def _copy_range(fsrc, fdst, offset: int, length: int) -> None:
+    """Copy length bytes from offset in fsrc to the current position of fdst"""
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while length > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), length, offset)
+                if not copied:
+                    break
+                offset += copied
+                length -= copied
+        except OSError:
+            pass
+    
+    fsrc.seek(offset)
+    while length > 0:
+        chunk = fsrc.read(min(length, 1 << 20))
+        if not chunk:
+            raise ValueError("Unexpected end of ASAR archive")
+        fdst.write(chunk)
+        length -= len(chunk)
+
+
+def _splice_asar(original_asar: Path, new_asar: Path, source_dir: Path,
+                 modified: Set[str]) -> None:
+    """
+    Write a new ASAR from the original, replacing only modified files
+    
+    Unchanged file data is copied straight from the original archive;
+    only the header and the modified files are rewritten.
+    
+    Args:
+        original_asar: Archive to take unchanged files from
+        new_asar: Destination archive
+        source_dir: Extracted tree holding the modified files
+        modified: Relative POSIX paths of files that changed
+        
+    Raises:
+        ValueError: If a modified file is not packed inside the archive
+    """
+    header, data_offset = _read_asar_header(original_asar)
+    entries = dict(_iter_asar_files(header))
+    
+    for path in modified:
+        entry = entries.get(path)
+        if entry is None or entry.get('unpacked') or 'offset' not in entry:
+            raise ValueError(f"{path} is not packed in {original_asar.name}")
+    
+    # Lay out packed files in their original order so unchanged data is
+    # read sequentially from the source archive
+    packed = sorted(((path, entry) for path, entry in entries.items()
+                     if not entry.get('unpacked')),
+                    key=lambda item: int(item[1]['offset']))
+    
+    plan: List[Tuple[str, int, int]] = []
+    offset = 0
+    for path, entry in packed:
+        old_offset = int(entry['offset'])
+        if path in modified:
+            size = (source_dir / path).stat().st_size
+            entry['size'] = size
+            if 'integrity' in entry:
+                entry['integrity'] = _asar_integrity(
+                    source_dir / path, entry['integrity'].get('blockSize', 4 * 1024 * 1024))
+        else:
+            size = entry['size']
+        entry['offset'] = str(offset)
+        plan.append((path, old_offset, size))
+        offset += size
+    
+    with open(original_asar, 'rb') as fsrc, open(new_asar, 'wb', buffering=0) as fdst:
+        fdst.write(_encode_asar_header(header))
+        for path, old_offset, size in plan:
+            if path in modified:
+                with open(source_dir / path, 'rb') as f:
+                    shutil.copyfileobj(f, fdst)
+            else:
+                _copy_range(fsrc, fdst, data_offset + old_offset, size)
+
+
+class _WalkCache:
+    """
+    Memoize _walk() results per directory
+    
+    Each listing records the mtime of every directory it walked, and is
+    reused only while none of them changed. Adding or removing an entry
+    anywhere in the tree updates its parent's mtime, so nested changes are
+    caught; callers that rewrite a tree wholesale may still call clear().
+    """
+    
+    def __init__(self):
+        self._entries: Dict[Tuple[str, Optional[str]], Tuple[Dict[str, int], List[str]]] = {}
+    
+    def walk(self, root: Union[str, Path], suffix: Optional[str] = None) -> List[str]:
+        """Return the files below root, walking only on a cache miss"""
+        key = (os.fspath(root), suffix)
+        
+        cached = self._entries.get(key)
+        if cached is not None and self._unchanged(cached[0]):
+            return cached[1]
+        
+        dir_mtimes: Dict[str, int] = {}
+        files = [entry.path for entry in _walk_entries(root, suffix, dir_mtimes)]
+        self._entries[key] = (dir_mtimes, files)
+        return files
+    
+    @staticmethod
+    def _unchanged(dir_mtimes: Dict[str, int]) -> bool:
+        """Return True if every recorded directory still has the same mtime"""
+        try:
+            return all(os.stat(directory).st_mtime_ns == mtime_ns
+                       for directory, mtime_ns in dir_mtimes.items())
+        except OSError:
+            return False
+    
+    def clear(self) -> None:
+        """Drop all cached listings"""
+        self._entries.clear()
+
+
+# Maps the "mappings" separators (',' and ';') to ',' and every other byte to 'a'
+_MAPPING_MARKS = bytes(44 if code in (44, 59) else 97 for code in range(256))
+
+
+def _count_mapping_segments(mappings: str) -> int:
+    """
+    Count the segments of a source map "mappings" string without decoding them
+    
+    Segments are the non-empty runs between separators, so once every byte
+    is reduced to one of two classes each segment starts at a ',a' pair.
+    """
+    marks = mappings.encode('ascii').translate(_MAPPING_MARKS)
+    return marks.count(b',a') + marks.startswith(b'a')
+
+
+def _parse_source_map(path: Union[str, Path]) -> Dict[str, int]:
+    """
+    Summarize the fields of a source map needed for analysis
+    
+    With ijson installed the file is streamed and large fields such as
+    sourcesContent are never kept in memory; otherwise json is used.
+    
+    Args:
+        path: Path to the .map file
+        
+    Returns:
+        Dictionary with the number of 'sources', 'names' and 'mappings' segments
+    """
+    sources = names = 0
+    mappings = ''
+    
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            try:
+                for prefix, event, value in ijson.parse(f):
+                    if prefix == 'sources.item':
+                        sources += 1
+                    elif prefix == 'names.item':
+                        names += 1
+                    elif prefix == 'mappings' and event == 'string':
+                        mappings = value
+            except ijson.JSONError as e:
+                # Report malformed maps like json.load does; the C backend
+                # appends a multi-line pointer to the message
+                raise ValueError(str(e).split('\n', 1)[0]) from e
+        else:
+            data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("not a source map object")
+            sources = len(data.get('sources') or [])
+            names = len(data.get('names') or [])
+            mappings = data.get('mappings') or ''
+    
+    return {
+        'sources': sources,
+        'names': names,
+        'mappings': _count_mapping_segments(mappings),
+    }
+
+
 class ElectronAnalyzer:
     """Main application class for Electron decompilation and analysis"""
     
@@ -72,14 +606,22 @@ class ElectronAnalyzer:
             
             # Initialize configuration
             self.config = AppConfig(script_dir=script_dir)
-            self.extracted_files: List[Path] = []
             self.modified_files: Set[Path] = set()
+            self._extract_snapshot: Dict[Path, Dict[str, Tuple[int, int]]] = {}
+            self._walk_cache = _WalkCache()
+            # Resolved path -> [mtime_ns, size, summary], least recently used first
+            self._source_map_cache: "OrderedDict[str, List[Any]]" = OrderedDict()
+            self._source_map_cache_loaded = False
+            self._source_map_cache_dirty = False
+            self._npm_ready = threading.Event()
+            # Set while an install, extraction or analysis runs on a worker thread
+            self._busy = threading.Event()
             
             # Initialize GUI
             self._init_gui()
             
-            # Find NPM installation
-            self.find_and_setup_npm()
+            # Find NPM installation in the background while the window starts
+            threading.Thread(target=self._find_npm_bg, daemon=True).start()
             
         except Exception as e:
             messagebox.showerror("Initialization Error", f"Error during startup: {e}")
@@ -90,7 +632,7 @@ class ElectronAnalyzer:
         self.root = tk.Tk()
         self.root.title("Electron Decompiler - Python 3.13.7")
         self.root.geometry("900x700")
-        self.root.configure(bg=Theme.BG.value)
+        self.root.configure(bg=_TH['BG'])
         
         # Configure styles
         self._configure_styles()
@@ -104,49 +646,49 @@ class ElectronAnalyzer:
         style.theme_use('clam')
         
         # Frame style
-        style.configure('Dark.TFrame', background=Theme.FRAME_BG.value)
+        style.configure('Dark.TFrame', background=_TH['FRAME_BG'])
         
         # Label style
         style.configure('Dark.TLabel',
-                       background=Theme.FRAME_BG.value,
-                       foreground=Theme.FG.value)
+                       background=_TH['FRAME_BG'],
+                       foreground=_TH['FG'])
         
         # Button style
         style.configure('Dark.TButton',
-                       background=Theme.BUTTON_BG.value,
-                       foreground=Theme.FG.value,
+                       background=_TH['BUTTON_BG'],
+                       foreground=_TH['FG'],
                        borderwidth=0,
-                       focuscolor=Theme.ACCENT.value,
+                       focuscolor=_TH['ACCENT'],
                        relief='flat',
                        padding=10)
         
         style.map('Dark.TButton',
-                 background=[('active', Theme.BUTTON_HOVER.value)])
+                 background=[('active', _TH['BUTTON_HOVER'])])
         
         # LabelFrame style
         style.configure('Dark.TLabelframe',
-                       background=Theme.FRAME_BG.value,
-                       foreground=Theme.FG.value,
-                       bordercolor=Theme.BUTTON_BG.value)
+                       background=_TH['FRAME_BG'],
+                       foreground=_TH['FG'],
+                       bordercolor=_TH['BUTTON_BG'])
         
         style.configure('Dark.TLabelframe.Label',
-                       background=Theme.FRAME_BG.value,
-                       foreground=Theme.ACCENT.value,
+                       background=_TH['FRAME_BG'],
+                       foreground=_TH['ACCENT'],
                        font=('Segoe UI', 10, 'bold'))
 
     def _setup_ui(self) -> None:
         """Setup the user interface components"""
         # Configure menu
-        self.root.option_add('*Menu.background', Theme.BUTTON_BG.value)
-        self.root.option_add('*Menu.foreground', Theme.FG.value)
-        self.root.option_add('*Menu.selectColor', Theme.ACCENT.value)
+        self.root.option_add('*Menu.background', _TH['BUTTON_BG'])
+        self.root.option_add('*Menu.foreground', _TH['FG'])
+        self.root.option_add('*Menu.selectColor', _TH['ACCENT'])
         
         # Menu bar
-        menubar = tk.Menu(self.root, bg=Theme.BUTTON_BG.value, fg=Theme.FG.value)
+        menubar = tk.Menu(self.root, bg=_TH['BUTTON_BG'], fg=_TH['FG'])
         self.root.config(menu=menubar)
         
         # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0, bg=Theme.BUTTON_BG.value, fg=Theme.FG.value)
+        help_menu = tk.Menu(menubar, tearoff=0, bg=_TH['BUTTON_BG'], fg=_TH['FG'])
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="Instructions", command=self.show_instructions)
         help_menu.add_command(label="About", command=self.show_about)
@@ -178,9 +720,9 @@ class ElectronAnalyzer:
         self.app_path_var = tk.StringVar()
         entry = tk.Entry(app_frame,
                         textvariable=self.app_path_var,
-                        bg=Theme.BUTTON_BG.value,
-                        fg=Theme.FG.value,
-                        insertbackground=Theme.FG.value,
+                        bg=_TH['BUTTON_BG'],
+                        fg=_TH['FG'],
+                        insertbackground=_TH['FG'],
                         relief='flat',
                         font=('Consolas', 10))
         entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
@@ -240,16 +782,16 @@ class ElectronAnalyzer:
         console_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
         # Create text widget with scrollbar
-        text_frame = tk.Frame(console_frame, bg=Theme.CONSOLE_BG.value)
+        text_frame = tk.Frame(console_frame, bg=_TH['CONSOLE_BG'])
         text_frame.pack(fill=tk.BOTH, expand=True)
         
         scrollbar = tk.Scrollbar(text_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         self.console = tk.Text(text_frame,
-                             bg=Theme.CONSOLE_BG.value,
-                             fg=Theme.CONSOLE_FG.value,
-                             insertbackground=Theme.FG.value,
+                             bg=_TH['CONSOLE_BG'],
+                             fg=_TH['CONSOLE_FG'],
+                             insertbackground=_TH['FG'],
                              relief='flat',
                              padx=10,
                              pady=10,
@@ -258,6 +800,16 @@ class ElectronAnalyzer:
         self.console.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.console.yview)
         
+        # Color mapping for message levels
+        self.console.tag_config('info', foreground=_TH['CONSOLE_FG'])
+        self.console.tag_config('success', foreground=_TH['SUCCESS'])
+        self.console.tag_config('error', foreground=_TH['ERROR'])
+        self.console.tag_config('warning', foreground='#ffa500')
+        
+        # Messages from any thread are queued and written by the Tk thread
+        self._log_queue: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        self.root.after(50, self._drain_log)
+        
         # Add clear button
         clear_btn = ttk.Button(console_frame,
                               text="Clear Console",
@@ -269,6 +821,9 @@ class ElectronAnalyzer:
         """
         Add message to console with optional color coding
         
+        Safe to call from worker threads; the message is queued and
+        written by the Tk thread.
+        
         Args:
             message: The message to log
             level: Message level ('info', 'success', 'error', 'warning')
@@ -277,23 +832,29 @@ class ElectronAnalyzer:
             print(message)
             return
         
-        # Color mapping
-        colors = {
-            'info': Theme.CONSOLE_FG.value,
-            'success': Theme.SUCCESS.value,
-            'error': Theme.ERROR.value,
-            'warning': '#ffa500'
-        }
+        self._log_queue.put((level, message))
+
+    def _drain_log(self) -> None:
+        """Write queued log messages to the console in a single insert"""
+        chunks: List[str] = []
+        for _ in range(_LOG_BATCH_SIZE):
+            try:
+                level, message = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            chunks.extend((f"{message}\n", level))
         
-        color = colors.get(level, Theme.CONSOLE_FG.value)
+        if chunks:
+            self.console.insert(tk.END, *chunks)
+            
+            # Drop the oldest lines once the console exceeds its limit
+            last_line = int(self.console.index('end-1c').split('.')[0])
+            if last_line - 1 > _CONSOLE_MAX_LINES:
+                self.console.delete('1.0', f'{last_line - _CONSOLE_MAX_LINES}.0')
+            
+            self.console.see(tk.END)
         
-        self.console.insert(tk.END, f"{message}\n")
-        # Apply color to the last line
-        last_line = self.console.index('end-1c linestart')
-        self.console.tag_add(level, last_line, 'end-1c')
-        self.console.tag_config(level, foreground=color)
-        self.console.see(tk.END)
-        self.root.update()
+        self.root.after(50, self._drain_log)
 
     def clear_console(self) -> None:
         """Clear the console output"""
@@ -306,7 +867,7 @@ class ElectronAnalyzer:
         
         npm_locations: List[str] = []
         
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             # Check common Windows locations
             npm_locations = [
                 r'C:\Program Files\nodejs\npm.cmd',
@@ -332,19 +893,84 @@ class ElectronAnalyzer:
             if npm_in_path:
                 npm_locations.insert(0, npm_in_path)
         
-        # Find npm
+        # Find npm, expanding wildcards (newest nvm version first) and
+        # probing each candidate once
+        seen: Set[str] = set()
         for location in npm_locations:
-            path = Path(location)
-            if path.exists():
-                self.config.npm_path = path
-                self.log(f"✓ Found npm at: {path}", 'success')
-                return
+            candidates = _newest_first(glob.iglob(location)) if '*' in location else (location,)
+            for candidate in candidates:
+                key = os.path.normcase(candidate)
+                if key in seen:
+                    continue
+                seen.add(key)
+                
+                if os.access(candidate, os.X_OK):
+                    path = Path(candidate)
+                    self.config.npm_path = path
+                    self.log(f"✓ Found npm at: {path}", 'success')
+                    self._resolve_asar_cli()
+                    return
         
         self.log("⚠ npm not found. Please install Node.js from https://nodejs.org/", 'warning')
 
+    def _find_npm_bg(self) -> None:
+        """Run the npm search on a worker thread and signal when it is done"""
+        try:
+            self.find_and_setup_npm()
+        finally:
+            self._npm_ready.set()
+
+    def _npm_search_finished(self) -> bool:
+        """Return True once the npm search is done, logging a notice otherwise"""
+        if self._npm_ready.wait(timeout=0):
+            return True
+        self.log("Still searching for npm, please try again in a moment", 'warning')
+        return False
+
+    def _task_running(self) -> bool:
+        """Return True while a background operation runs, logging a notice"""
+        if not self._busy.is_set():
+            return False
+        self.log("Another operation is still running, please wait for it to finish", 'warning')
+        return True
+
+    def _resolve_asar_cli(self) -> None:
+        """Locate the globally installed asar CLI so it can be run with node directly"""
+        node = shutil.which('node')
+        if not node or not self.config.npm_path:
+            return
+        
+        try:
+            result = subprocess.run([str(self.config.npm_path), 'root', '-g'],
+                                    capture_output=True, text=True, timeout=30)
+        except (subprocess.TimeoutExpired, OSError):
+            return
+        
+        if result.returncode != 0:
+            return
+        
+        global_root = Path(result.stdout.strip())
+        for package in ('asar', Path('@electron') / 'asar'):
+            cli = global_root / package / 'bin' / 'asar.js'
+            if cli.is_file():
+                self.config.node_path = Path(node)
+                self.config.asar_cli = cli
+                return
+
+    def _asar_command(self, *args: str) -> List[str]:
+        """
+        Build the command line for an asar operation
+        
+        Runs asar.js with node directly when it was found, which avoids
+        starting a second Node.js process through `npm exec`.
+        """
+        if self.config.node_path and self.config.asar_cli:
+            return [str(self.config.node_path), str(self.config.asar_cli), *args]
+        return [str(self.config.npm_path), 'exec', 'asar', *args]
+
     def browse_app(self) -> None:
         """Open file dialog to select Electron application"""
-        filetypes = [("Executable files", "*.exe"), ("All files", "*.*")] if platform.system() == 'Windows' else [("All files", "*.*")]
+        filetypes = [("Executable files", "*.exe"), ("All files", "*.*")] if _IS_WINDOWS else [("All files", "*.*")]
         
         filename = filedialog.askopenfilename(
             title="Select Electron Application",
@@ -364,6 +990,9 @@ class ElectronAnalyzer:
 
     def install_tools(self) -> None:
         """Install required npm packages"""
+        if not self._npm_search_finished() or self._task_running():
+            return
+        
         if not self.config.npm_path:
             messagebox.showerror("Error", "npm not found. Please install Node.js first.")
             return
@@ -376,34 +1005,85 @@ class ElectronAnalyzer:
         
         self.log("Installing required npm packages...", 'info')
         
-        for package in packages:
-            try:
+        # Run the installs off the Tk thread so the UI stays responsive
+        self._busy.set()
+        threading.Thread(target=self._install_bg, args=(packages,), daemon=True).start()
+
+    def _install_bg(self, packages: List[str]) -> None:
+        """Run the npm installs on a worker thread, clearing the busy flag after"""
+        try:
+            asyncio.run(self._install_packages(packages))
+        finally:
+            self._busy.clear()
+
+    async def _install_packages(self, packages: List[str]) -> None:
+        """Install npm packages in one npm run, falling back to one by one"""
+        if await self._npm_install(packages, timeout=300):
+            for package in packages:
+                self.log(f"✓ {package} installed successfully", 'success')
+        else:
+            self.log("Combined install failed, installing packages individually...", 'warning')
+            for package in packages:
                 self.log(f"Installing {package}...", 'info')
-                result = subprocess.run(
-                    [str(self.config.npm_path), 'install', '-g', package],
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
-                
-                if result.returncode == 0:
+                if await self._npm_install([package], timeout=120):
                     self.log(f"✓ {package} installed successfully", 'success')
-                else:
-                    self.log(f"✗ Failed to install {package}: {result.stderr}", 'error')
-                    
-            except subprocess.TimeoutExpired:
-                self.log(f"✗ Installation of {package} timed out", 'error')
-            except Exception as e:
-                self.log(f"✗ Error installing {package}: {e}", 'error')
         
+        self._resolve_asar_cli()
         self.log("Installation complete!", 'success')
 
+    async def _npm_install(self, packages: List[str], timeout: int) -> bool:
+        """
+        Run `npm install -g` for the given packages
+        
+        Args:
+            packages: npm package names to install
+            timeout: Seconds to wait before killing npm
+            
+        Returns:
+            True if npm exited successfully, False otherwise
+        """
+        label = ', '.join(packages)
+        
+        try:
+            # npm's progress output is not used; stderr is only read on failure.
+            # A session of its own lets a timeout kill npm's children as well
+            proc = await asyncio.create_subprocess_exec(
+                str(self.config.npm_path), 'install', '-g', *packages,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True
+            )
+            
+            try:
+                _, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+            except asyncio.TimeoutError:
+                _kill_tree(proc)
+                try:
+                    await asyncio.wait_for(proc.wait(), 5)
+                except asyncio.TimeoutError:
+                    pass  # Something outside the session still holds stderr
+                self.log(f"✗ Installation of {label} timed out", 'error')
+                return False
+            
+            if proc.returncode != 0:
+                error = stderr[-_STDERR_LIMIT:].decode(errors='replace')
+                self.log(f"✗ Failed to install {label}: {error}", 'error')
+                return False
+            return True
+            
+        except Exception as e:
+            self.log(f"✗ Error installing {label}: {e}", 'error')
+            return False
+
     def extract_asar(self) -> None:
         """Extract ASAR archive from Electron application"""
         if not self.config.app_path or not self.config.app_path.exists():
             messagebox.showerror("Error", "Please select a valid application first")
             return
         
+        if not self._npm_search_finished() or self._task_running():
+            return
+        
         try:
             self.log("Searching for ASAR files...", 'info')
             
@@ -416,7 +1096,7 @@ class ElectronAnalyzer:
                 return
             
             # Find ASAR files
-            asar_files = list(resources_dir.glob('*.asar'))
+            asar_files = _find_suffix(resources_dir, '.asar')
             
             if not asar_files:
                 self.log("✗ No ASAR files found", 'error')
@@ -424,56 +1104,192 @@ class ElectronAnalyzer:
             
             self.log(f"Found {len(asar_files)} ASAR file(s)", 'success')
             
-            # Extract each ASAR file
-            for asar_file in asar_files:
-                output_path = self.config.output_dir / asar_file.stem
-                output_path.mkdir(parents=True, exist_ok=True)
-                
-                self.log(f"Extracting {asar_file.name}...", 'info')
-                
-                # Use asar npm package
-                cmd = [str(self.config.npm_path), 'exec', 'asar', 'extract', 
-                       str(asar_file), str(output_path)]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True)
+            # Extract on a worker thread so the UI stays responsive
+            self._busy.set()
+            threading.Thread(target=self._extract_all, args=(asar_files,), daemon=True).start()
+            
+        except Exception as e:
+            self.log(f"✗ Error during extraction: {e}", 'error')
+            messagebox.showerror("Error", f"Extraction failed: {e}")
+
+    def _extract_all(self, asar_files: List[Path]) -> None:
+        """Extract ASAR archives in parallel, reporting each as it completes"""
+        try:
+            self._extract_parallel(asar_files)
+        finally:
+            self._walk_cache.clear()
+            self._busy.clear()
+
+    def _extract_parallel(self, asar_files: List[Path]) -> None:
+        """Run _extract_one for each archive on a small thread pool"""
+        total = len(asar_files)
+        
+        with ThreadPoolExecutor(max_workers=min(4, total)) as executor:
+            futures = {executor.submit(self._extract_one, asar_file): asar_file
+                       for asar_file in asar_files}
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                asar_file = futures[future]
+                try:
+                    output_path, returncode, stderr = future.result()
+                except Exception as e:
+                    self.log(f"[{done}/{total}] ✗ Error extracting {asar_file.name}: {e}", 'error')
+                    continue
                 
-                if result.returncode == 0:
-                    self.log(f"✓ Extracted to: {output_path}", 'success')
-                    self.extracted_files = list(output_path.rglob('*'))
+                if returncode == 0:
+                    snapshot = self._extract_snapshot.get(output_path)
+                    extracted = f"{len(snapshot)} file(s)" if snapshot is not None else asar_file.name
+                    self.log(f"[{done}/{total}] ✓ Extracted {extracted} to: {output_path}", 'success')
                     
                     # Open output directory
-                    if platform.system() == 'Windows':
-                        os.startfile(output_path)
-                    elif platform.system() == 'Darwin':
-                        subprocess.run(['open', str(output_path)])
-                    else:
-                        subprocess.run(['xdg-open', str(output_path)])
+                    self._open_dir_in_background(output_path)
                 else:
-                    self.log(f"✗ Extraction failed: {result.stderr}", 'error')
-                    
-        except Exception as e:
-            self.log(f"✗ Error during extraction: {e}", 'error')
-            messagebox.showerror("Error", f"Extraction failed: {e}")
+                    self.log(
+                        f"[{done}/{total}] ✗ Extraction of {asar_file.name} failed: {stderr}", 'error')
+
+    def _extract_one(self, asar_file: Path) -> Tuple[Path, int, str]:
+        """
+        Extract a single ASAR archive and snapshot the extracted files
+        
+        Returns:
+            The output directory, asar's exit code and its stderr
+        """
+        output_path = self.config.output_dir / asar_file.stem
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        self.log(f"Extracting {asar_file.name}...", 'info')
+        
+        # Use asar npm package
+        cmd = self._asar_command('extract', str(asar_file), str(output_path))
+        
+        returncode, stderr = _run_quiet(cmd)
+        
+        if returncode == 0:
+            try:
+                self._extract_snapshot[output_path] = _snapshot_tree(output_path)
+            except OSError:
+                # Without a snapshot, recompiling falls back to a full repack
+                self._extract_snapshot.pop(output_path, None)
+        
+        return output_path, returncode, stderr
 
     def analyze_source_maps(self) -> None:
         """Analyze source maps in extracted files"""
+        if self._task_running():
+            return
+        
         if not self.config.output_dir or not self.config.output_dir.exists():
             messagebox.showerror("Error", "Please extract ASAR first")
             return
         
         self.log("Analyzing source maps...", 'info')
         
-        # Find .map files
-        map_files = list(self.config.output_dir.rglob('*.map'))
+        # Parse on a worker thread so large maps do not freeze the UI
+        self._busy.set()
+        threading.Thread(target=self._analyze_bg, args=(self.config.output_dir,),
+                         daemon=True).start()
+
+    def _analyze_bg(self, output_dir: Path) -> None:
+        """Analyze source maps on a worker thread, clearing the busy flag after"""
+        try:
+            self._analyze_source_maps(output_dir)
+        except Exception as e:
+            self.log(f"✗ Source map analysis failed: {e}", 'error')
+        finally:
+            self._busy.clear()
+
+    def _analyze_source_maps(self, output_dir: Path) -> None:
+        """Summarize every source map below output_dir"""
+        if not self._source_map_cache_loaded:
+            self._read_source_map_cache()
+        
+        # Find .map files, logging them as they are discovered
+        map_count = 0
+        for map_file in self._walk_cache.walk(output_dir, '.map'):
+            map_count += 1
+            relative = os.path.relpath(map_file, output_dir)
+            try:
+                summary = self._load_source_map(Path(map_file))
+                self.log(f"  • {relative} ({summary['sources']} sources, "
+                         f"{summary['mappings']} mappings)", 'info')
+            except (OSError, ValueError) as e:
+                self.log(f"  • {relative} (unreadable: {e})", 'warning')
         
-        if not map_files:
+        self._write_source_map_cache()
+        
+        if not map_count:
             self.log("⚠ No source map files found", 'warning')
             return
         
-        self.log(f"Found {len(map_files)} source map file(s)", 'success')
+        self.log(f"Found {map_count} source map file(s)", 'success')
+
+    def _load_source_map(self, map_file: Path) -> Dict[str, int]:
+        """
+        Summarize a source map, reusing the cached summary when unchanged
+        
+        Args:
+            map_file: Path to the .map file
+            
+        Returns:
+            Source map summary as returned by _parse_source_map
+        """
+        stat = map_file.stat()
+        cache_key = str(map_file.resolve())
+        
+        cached = self._source_map_cache.get(cache_key)
+        if cached is not None and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+            self._source_map_cache.move_to_end(cache_key)
+            return cached[2]
+        
+        summary = _parse_source_map(map_file)
+        # Only cache after a successful parse so failures are retried; this
+        # also replaces any entry for an older version of the file
+        self._source_map_cache[cache_key] = [stat.st_mtime_ns, stat.st_size, summary]
+        self._source_map_cache.move_to_end(cache_key)
+        while len(self._source_map_cache) > _SOURCE_MAP_CACHE_SIZE:
+            self._source_map_cache.popitem(last=False)
+        self._source_map_cache_dirty = True
+        return summary
+
+    def _source_map_cache_file(self) -> Path:
+        """Location of the on-disk source map summary cache"""
+        return self.config.script_dir / '.cache' / 'source-maps.json'
+
+    def _read_source_map_cache(self) -> None:
+        """Load the on-disk source map summaries into memory"""
+        self._source_map_cache_loaded = True
+        cache_file = self._source_map_cache_file()
+        
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if not isinstance(entries, dict):
+            return
+        
+        for cache_key, entry in list(entries.items())[-_SOURCE_MAP_CACHE_SIZE:]:
+            if isinstance(entry, list) and len(entry) == 3:
+                self._source_map_cache[cache_key] = entry
+
+    def _write_source_map_cache(self) -> None:
+        """Save the cached source map summaries to disk"""
+        if not self._source_map_cache_dirty:
+            return
+        
+        entries = dict(self._source_map_cache)
+        cache_file = self._source_map_cache_file()
+        temp_file = cache_file.with_suffix('.tmp')
         
-        for map_file in map_files:
-            self.log(f"  • {map_file.relative_to(self.config.output_dir)}", 'info')
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(temp_file, cache_file)
+            self._source_map_cache_dirty = False
+        except OSError:
+            pass  # Caching is best-effort
 
     def setup_devtools(self) -> None:
         """Setup development tools for Electron app"""
@@ -490,22 +1306,27 @@ class ElectronAnalyzer:
             return
         
         # Open output directory
-        try:
-            if platform.system() == 'Windows':
-                os.startfile(self.config.output_dir)
-            elif platform.system() == 'Darwin':
-                subprocess.run(['open', str(self.config.output_dir)])
-            else:
-                subprocess.run(['xdg-open', str(self.config.output_dir)])
-            
-            self.log(f"Opened directory: {self.config.output_dir}", 'success')
-            self.log("Edit your files and then click 'Recompile & Apply Changes'", 'info')
-            
-        except Exception as e:
-            self.log(f"✗ Error opening directory: {e}", 'error')
+        self._open_dir_in_background(self.config.output_dir)
+        
+        self.log(f"Opened directory: {self.config.output_dir}", 'success')
+        self.log("Edit your files and then click 'Recompile & Apply Changes'", 'info')
+
+    def _open_dir_in_background(self, path: Path) -> None:
+        """Open a directory on a worker thread so the UI is not blocked"""
+        def opener() -> None:
+            try:
+                _open_dir(path)
+            except Exception as e:
+                self.log(f"✗ Error opening directory: {e}", 'error')
+        
+        threading.Thread(target=opener, daemon=True).start()
 
     def recompile_changes(self) -> None:
         """Recompile modified files back into ASAR"""
+        # Never pack a tree that is still being extracted
+        if self._task_running():
+            return
+        
         if not self.config.output_dir or not self.config.output_dir.exists():
             messagebox.showerror("Error", "No extracted files found")
             return
@@ -514,53 +1335,116 @@ class ElectronAnalyzer:
             messagebox.showerror("Error", "Original application path not found")
             return
         
+        if not self._npm_search_finished():
+            return
+        
+        self.log("Starting recompilation...", 'info')
+        
+        # Copy, pack and replace on a worker thread so progress stays visible
+        self._busy.set()
+        threading.Thread(target=self._recompile_bg, daemon=True).start()
+
+    def _recompile_bg(self) -> None:
+        """Recompile on a worker thread, reporting the outcome on the Tk thread"""
         try:
-            self.log("Starting recompilation...", 'info')
-            
-            # Find original ASAR
-            app_dir = self.config.app_path.parent
-            resources_dir = app_dir / 'resources'
-            asar_files = list(resources_dir.glob('*.asar'))
-            
-            if not asar_files:
-                raise FileNotFoundError("Original ASAR file not found")
-            
-            original_asar = asar_files[0]
-            
-            # Create backup
-            backup_path = original_asar.with_suffix('.asar.backup')
-            if not backup_path.exists():
-                shutil.copy2(original_asar, backup_path)
-                self.log(f"✓ Created backup: {backup_path.name}", 'success')
-            
-            # Pack new ASAR
-            source_dir = self.config.output_dir / original_asar.stem
-            new_asar = self.config.output_dir / 'app.asar'
-            
+            backup_name = self._recompile()
+            if backup_name is not None:
+                self.root.after(0, messagebox.showinfo, "Success",
+                                f"Changes have been applied!\n"
+                                f"Backup saved as: {backup_name}")
+        except Exception as e:
+            self.log(f"✗ Recompilation failed: {e}", 'error')
+            self.root.after(0, messagebox.showerror, "Error", f"Recompilation failed: {e}")
+        finally:
+            self._busy.clear()
+
+    def _recompile(self) -> Optional[str]:
+        """
+        Pack the extracted files and replace the original ASAR
+        
+        Returns:
+            The backup file name, or None if nothing had changed
+        """
+        # Find original ASAR
+        app_dir = self.config.app_path.parent
+        resources_dir = app_dir / 'resources'
+        asar_files = _find_suffix(resources_dir, '.asar')
+        
+        if not asar_files:
+            raise FileNotFoundError("Original ASAR file not found")
+        
+        original_asar = asar_files[0]
+        source_dir = self.config.output_dir / original_asar.stem
+        new_asar = self.config.output_dir / 'app.asar'
+        
+        # Compare against the state recorded at extraction time
+        modified = self._find_modified_files(source_dir)
+        if modified is not None:
+            if not modified:
+                self.log("No changes since extraction, nothing to recompile", 'info')
+                return None
+            self.modified_files = {source_dir / path for path in modified}
+            self.log(f"Detected {len(modified)} modified file(s)", 'info')
+        
+        # Create backup
+        backup_path = original_asar.with_suffix('.asar.backup')
+        if not backup_path.exists():
+            _fast_copy(original_asar, backup_path)
+            self.log(f"✓ Created backup: {backup_path.name}", 'success')
+        
+        # Patch only the modified files into the archive when possible
+        patched = False
+        if modified and self.config.incremental_repack:
+            try:
+                self.log("Patching modified files into ASAR...", 'info')
+                _splice_asar(original_asar, new_asar, source_dir, modified)
+                patched = True
+            except (OSError, ValueError, KeyError) as e:
+                self.log(f"Incremental patch not possible ({e}), repacking", 'warning')
+        
+        # Pack new ASAR
+        if not patched:
             self.log(f"Packing {source_dir.name}...", 'info')
             
-            cmd = [str(self.config.npm_path), 'exec', 'asar', 'pack',
-                   str(source_dir), str(new_asar)]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            cmd = self._asar_command('pack', str(source_dir), str(new_asar))
             
-            if result.returncode != 0:
-                raise Exception(f"Packing failed: {result.stderr}")
+            returncode, stderr = _run_quiet(cmd)
             
-            self.log("✓ Successfully created new ASAR", 'success')
-            
-            # Replace original ASAR
-            if self._replace_asar(new_asar, original_asar):
-                self.log("✓ Successfully replaced original ASAR", 'success')
-                messagebox.showinfo("Success",
-                                  f"Changes have been applied!\n"
-                                  f"Backup saved as: {backup_path.name}")
-            else:
-                raise Exception("Failed to replace ASAR file")
-                
-        except Exception as e:
-            self.log(f"✗ Recompilation failed: {e}", 'error')
-            messagebox.showerror("Error", f"Recompilation failed: {e}")
+            if returncode != 0:
+                raise Exception(f"Packing failed: {stderr}")
+        
+        self.log("✓ Successfully created new ASAR", 'success')
+        
+        # Replace original ASAR
+        if not self._replace_asar(new_asar, original_asar):
+            raise Exception("Failed to replace ASAR file")
+        
+        self.log("✓ Successfully replaced original ASAR", 'success')
+        if source_dir in self._extract_snapshot:
+            self._extract_snapshot[source_dir] = _snapshot_tree(source_dir)
+        return backup_path.name
+
+    def _find_modified_files(self, source_dir: Path) -> Optional[Set[str]]:
+        """
+        List files changed under source_dir since it was extracted
+        
+        Returns:
+            Relative POSIX paths of modified files, or None if there is no
+            snapshot or files were added or removed (a full repack is needed)
+        """
+        baseline = self._extract_snapshot.get(source_dir)
+        if baseline is None:
+            return None
+        
+        try:
+            current = _snapshot_tree(source_dir)
+        except OSError:
+            return None
+        
+        if current.keys() != baseline.keys():
+            return None
+        
+        return {path for path, stat in current.items() if baseline[path] != stat}
 
     def _replace_asar(self, new_asar: Path, original_asar: Path) -> bool:
         """
@@ -573,17 +1457,21 @@ class ElectronAnalyzer:
         Returns:
             True if successful, False otherwise
         """
+        rename = _win_move if _IS_WINDOWS else os.replace
+        
         methods: List[Callable[[], None]] = [
-            # Method 1: Direct replacement
+            # Method 1: Atomic rename (same filesystem only)
+            lambda: rename(new_asar, original_asar),
+            # Method 2: Direct replacement
             lambda: shutil.copy2(new_asar, original_asar),
         ]
         
         # Windows-specific methods
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             methods.extend([
-                # Method 2: Take ownership
+                # Method 3: Take ownership
                 lambda: self._take_ownership_and_replace(new_asar, original_asar),
-                # Method 3: PowerShell elevated copy
+                # Method 4: PowerShell elevated copy
                 lambda: subprocess.run(
                     f'powershell Start-Process cmd -Verb RunAs -ArgumentList '
                     f'"/c copy /Y \\"{new_asar}\\" \\"{original_asar}\\""',
@@ -606,7 +1494,7 @@ class ElectronAnalyzer:
 
     def _take_ownership_and_replace(self, new_asar: Path, original_asar: Path) -> None:
         """Take ownership of file and replace it (Windows only)"""
-        if platform.system() != 'Windows':
+        if not _IS_WINDOWS:
             raise OSError("This method is only available on Windows")
         
         subprocess.run(['takeown', '/F', str(original_asar)], shell=True, check=True)
@@ -619,10 +1507,10 @@ class ElectronAnalyzer:
         readme = tk.Toplevel(self.root)
         readme.title("Instructions - Electron Decompiler")
         readme.geometry("700x500")
-        readme.configure(bg=Theme.BG.value)
+        readme.configure(bg=_TH['BG'])
         
         # Create frame
-        frame = tk.Frame(readme, bg=Theme.BG.value)
+        frame = tk.Frame(readme, bg=_TH['BG'])
         frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Text widget
@@ -630,9 +1518,9 @@ class ElectronAnalyzer:
                       wrap=tk.WORD,
                       padx=15,
                       pady=15,
-                      bg=Theme.CONSOLE_BG.value,
-                      fg=Theme.FG.value,
-                      insertbackground=Theme.FG.value,
+                      bg=_TH['CONSOLE_BG'],
+                      fg=_TH['FG'],
+                      insertbackground=_TH['FG'],
                       font=('Segoe UI', 10))
         text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
@@ -641,77 +1529,7 @@ class ElectronAnalyzer:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         text.config(yscrollcommand=scrollbar.set)
         
-        instructions = """
-╔══════════════════════════════════════════════════════════╗
-║        Electron Application Decompiler v2.0              ║
-║        Compatible with Python 3.13.7                     ║
-╚══════════════════════════════════════════════════════════╝
-
-📋 PREREQUISITES
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-1. Install Node.js from https://nodejs.org/
-2. Run as Administrator (Windows) or with sudo (Linux/Mac)
-3. Click "Install Required Tools" before first use
-
-📖 STEP-BY-STEP GUIDE
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-1. APPLICATION SELECTION
-   • Click "Browse" to select your Electron .exe file
-   • Output directory will be created automatically
-
-2. TOOLS INSTALLATION
-   • Click "Install Required Tools"
-   • Wait for npm packages to install
-   • Check console for success messages
-
-3. EXTRACTION
-   • Click "Extract ASAR Archive"
-   • Files will be extracted to: [app_name]/
-   • Directory will open automatically
-
-4. ANALYSIS
-   • "Analyze Source Maps" - View available source maps
-   • "Setup Development Tools" - Get DevTools instructions
-
-5. MODIFICATION
-   • Click "Edit Extracted Files" to open the directory
-   • Modify files using your preferred text editor
-   
-   Common files to edit:
-   ├── main.js          → Main process code
-   ├── renderer.js      → Renderer process code
-   ├── index.html       → Application UI
-   └── package.json     → App configuration
-
-6. RECOMPILATION
-   • Click "Recompile & Apply Changes"
-   • Backup created automatically (.asar.backup)
-   • Original file will be replaced
-
-🔧 TROUBLESHOOTING
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-• npm not found → Install Node.js and restart
-• Extraction fails → Check app directory structure
-• Recompile fails → Run as administrator
-• Console shows detailed error messages
-
-⚠️ IMPORTANT NOTES
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-• Always backup before modifying applications
-• Some apps may have additional protection
-• Modifications might break functionality
-• Use for educational purposes only
-
-💡 TIPS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-• Use a good code editor (VS Code, Sublime Text)
-• Test modifications in a safe environment
-• Keep backups of working versions
-• Check console output for detailed information
-"""
-        
-        text.insert('1.0', instructions)
+        text.insert('1.0', _INSTRUCTIONS)
         text.config(state='disabled')
         
         # Close button
@@ -720,20 +1538,7 @@ class ElectronAnalyzer:
 
     def show_about(self) -> None:
         """Show about dialog"""
-        about_text = (
-            "Electron Application Decompiler\n\n"
-            "Version: 2.0\n"
-            "Python: 3.13.7 Compatible\n\n"
-            "A tool for extracting, analyzing, and modifying\n"
-            "Electron-based applications.\n\n"
-            "Features:\n"
-            "• ASAR extraction and packing\n"
-            "• Source map analysis\n"
-            "• File modification support\n"
-            "• Automatic backup creation\n\n"
-            "Use responsibly and ethically."
-        )
-        messagebox.showinfo("About", about_text)
+        messagebox.showinfo("About", _ABOUT_TEXT)
 
     def run(self) -> None:
         """Start the application main loop"""
@@ -4,229 +4,599 @@ Compatible with Python 3.13.7
 Installs necessary Node.js packages and verifies Python environment
 """
 
+import argparse
+import asyncio
 import subprocess
 import sys
 import os
-import platform
+import shutil
+import json
+import re
+import io
+import time
+import hashlib
+import signal
+import socket
+import threading
+from importlib.util import find_spec
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Dict, Optional, TextIO
+
+
+# Built-in modules the decompiler depends on
+REQUIRED_MODULES: Tuple[Tuple[str, str], ...] = (
+    ('tkinter', 'GUI framework'),
+    ('pathlib', 'Path handling'),
+    ('ctypes', 'C library interface (Windows)'),
+    ('subprocess', 'Process management'),
+    ('json', 'JSON parsing'),
+    ('platform', 'Platform information'),
+    ('tempfile', 'Temporary files'),
+    ('re', 'Regular expressions'),
+)
+
+# Optional pip packages that enhance functionality
+OPTIONAL_PIP_PACKAGES: Tuple[Tuple[str, str, str], ...] = (
+    ('pillow', 'PIL', 'Image processing (if working with icons)'),
+    ('beautifulsoup4', 'bs4', 'HTML parsing (if analyzing HTML)'),
+    ('requests', 'requests', 'HTTP requests (for downloading resources)'),
+)
+
+# Essential npm packages for Electron decompilation
+NPM_PACKAGES: Tuple[Tuple[str, str], ...] = (
+    ('asar', 'ASAR archive packing/unpacking'),
+    ('electron-devtools-installer', 'Development tools installer'),
+    ('source-map-explorer', 'Source map analysis'),
+)
+
+# Environment probe results are reused for this many seconds
+_PROBE_CACHE_TTL = 24 * 60 * 60
+
+_RULE = "=" * 60
+_DIV = _RULE + "\n"
+
+_BANNER = """
+
+╔══════════════════════════════════════════════════════════╗
+║   Electron Decompiler - Requirements Installer          ║
+║   Python 3.13.7 Compatible                              ║
+╚══════════════════════════════════════════════════════════╝
+
+"""
+
+# Environment for every npm child: non-interactive, no colour, progress,
+# funding, audit or update-check work
+_NPM_ENV = {
+    **os.environ,
+    'CI': '1',
+    'NO_COLOR': '1',
+    'NPM_CONFIG_PROGRESS': 'false',
+    'NPM_CONFIG_FUND': 'false',
+    'NPM_CONFIG_AUDIT': 'false',
+    'NPM_CONFIG_UPDATE_NOTIFIER': 'false',
+}
+
+# Oldest Python version the decompiler runs on
+_MIN_PY: Tuple[int, int] = (3, 9)
+
+# Oldest Node.js major version the asar tooling supports
+_MIN_NODE_MAJOR = 16
+
+# Names of the standard library modules (Python 3.10+; empty before that)
+_STDLIB_MODULES = getattr(sys, 'stdlib_module_names', frozenset())
+
+_VER_RE = re.compile(r'v?(\d+)\.(\d+)\.(\d+)')
+
+# Skip the audit, funding and progress work npm does on every install
+_NPM_INSTALL_FLAGS = (
+    '--prefer-offline',
+    '--no-audit',
+    '--no-fund',
+    '--no-progress',
+    '--loglevel=error',
+)
+
+
+def _probe_cache_path() -> Path:
+    """Location of the persisted environment probe results"""
+    return Path.home() / ".cache" / "electrolyze" / "env-probe.json"
+
+
+def _probe_cache_key() -> str:
+    """Key identifying the interpreter, machine, PATH and Node.js binary the probes ran against"""
+    import platform
+    
+    # Node.js upgraded in place keeps its path, so include the real binary's stat
+    node_path = shutil.which('node')
+    node_stamp = ''
+    if node_path is not None:
+        try:
+            node_real = os.path.realpath(node_path)
+            node_stat = os.stat(node_real)
+            node_stamp = f"{node_real}:{node_stat.st_mtime_ns}:{node_stat.st_size}"
+        except OSError:
+            node_stamp = node_path
+    
+    fingerprint = f"{sys.version}|{platform.machine()}|{os.environ.get('PATH', '')}|{node_stamp}"
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def _load_probe_cache(key: str) -> Optional[Dict[str, object]]:
+    """Return cached probe results for key if they are still fresh"""
+    try:
+        with open(_probe_cache_path(), encoding='utf-8') as f:
+            entry = json.load(f).get(key)
+    except (OSError, ValueError, AttributeError):
+        return None
+    
+    if not isinstance(entry, dict) or entry.get('timestamp', 0) <= time.time() - _PROBE_CACHE_TTL:
+        return None
+    return entry
+
+
+def _save_probe_cache(key: str, npm_version: str) -> None:
+    """Persist successful probe results under key"""
+    path = _probe_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({key: {'timestamp': time.time(), 'npm_version': npm_version}}, f)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def _parse_version(text: str) -> Optional[Tuple[int, int, int]]:
+    """Extract the first major.minor.patch version from a tool's output"""
+    match = _VER_RE.search(text)
+    if match is None:
+        return None
+    major, minor, patch = map(int, match.groups())
+    return major, minor, patch
+
+
+def _prewarm_registry_dns() -> None:
+    """Resolve the npm registry so the OS resolver cache is warm for npm"""
+    try:
+        socket.getaddrinfo('registry.npmjs.org', 443)
+    except OSError:
+        pass
+
+
+def _kill_tree(proc: asyncio.subprocess.Process) -> None:
+    """Kill a child process together with any processes it started"""
+    if sys.platform == 'win32':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(proc.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return
+    
+    # Children are started in their own session, so the pid is the group id
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _write_lines(lines: List[str], out: Optional[TextIO] = None) -> None:
+    """Write collected output lines with a single write call"""
+    (out or sys.stdout).write("\n".join(lines) + "\n")
 
 
 class RequirementsInstaller:
     """Handle installation of required dependencies"""
     
-    def __init__(self):
-        self.python_version = sys.version_info
+    def __init__(self, auto_yes: bool = False):
+        # platform is only needed once an installer exists, not on module import
+        import platform
+        
         self.platform = platform.system()
+        self.auto_yes = auto_yes
         
     def check_python_version(self) -> bool:
         """Verify Python version meets requirements"""
-        print("=" * 60)
-        print("Python Environment Check")
-        print("=" * 60)
-        print(f"Python Version: {sys.version}")
-        print(f"Platform: {self.platform}")
-        print(f"Architecture: {platform.machine()}")
-        print()
-        
-        if self.python_version < (3, 9):
-            print("❌ ERROR: Python 3.9 or higher is required")
-            print(f"   Current version: {self.python_version.major}.{self.python_version.minor}.{self.python_version.micro}")
-            return False
+        import platform
         
-        print("✓ Python version is compatible")
-        return True
+        lines = [
+            _RULE,
+            "Python Environment Check",
+            _RULE,
+            f"Python Version: {sys.version}",
+            f"Platform: {self.platform}",
+            f"Architecture: {platform.machine()}",
+            "",
+        ]
+        
+        compatible = sys.version_info[:2] >= _MIN_PY
+        if compatible:
+            lines.append("✓ Python version is compatible")
+        else:
+            lines.append(f"❌ ERROR: Python {'.'.join(map(str, _MIN_PY))} or higher is required")
+            lines.append(f"   Current version: {'.'.join(map(str, sys.version_info[:3]))}")
+        
+        _write_lines(lines)
+        return compatible
     
-    def verify_builtin_modules(self) -> bool:
+    def verify_builtin_modules(self, out: Optional[TextIO] = None) -> bool:
         """Verify that required built-in modules are available"""
-        print("\n" + "=" * 60)
-        print("Verifying Built-in Python Modules")
-        print("=" * 60)
-        
-        required_modules = [
-            ('tkinter', 'GUI framework'),
-            ('pathlib', 'Path handling'),
-            ('ctypes', 'C library interface (Windows)'),
-            ('subprocess', 'Process management'),
-            ('json', 'JSON parsing'),
-            ('platform', 'Platform information'),
-            ('tempfile', 'Temporary files'),
-            ('re', 'Regular expressions'),
+        lines = [
+            "\n" + _RULE,
+            "Verifying Built-in Python Modules",
+            _RULE,
         ]
         
+        def is_available(module_name: str) -> bool:
+            # tkinter is listed as stdlib but is often packaged separately,
+            # so it always gets a real lookup
+            if module_name != 'tkinter' and module_name in _STDLIB_MODULES:
+                return True
+            # Locate the module without executing it (no Tk/Tcl start-up)
+            if find_spec(module_name) is None:
+                return False
+            # tkinter itself is pure Python; the Tk bindings live in _tkinter
+            return module_name != 'tkinter' or find_spec('_tkinter') is not None
+        
+        found = [is_available(module_name) for module_name, _ in REQUIRED_MODULES]
+        
         all_available = True
         
-        for module_name, description in required_modules:
-            try:
-                __import__(module_name)
-                print(f"✓ {module_name:<15} - {description}")
-            except ImportError:
-                print(f"❌ {module_name:<15} - {description} (NOT FOUND)")
+        for (module_name, description), available in zip(REQUIRED_MODULES, found):
+            if available:
+                lines.append(f"✓ {module_name:<15} - {description}")
+            else:
+                lines.append(f"❌ {module_name:<15} - {description} (NOT FOUND)")
                 all_available = False
                 
                 if module_name == 'tkinter':
-                    print(f"   Install tkinter using:")
+                    lines.append(f"   Install tkinter using:")
                     if self.platform == 'Linux':
-                        print(f"   sudo apt-get install python3-tk")
+                        lines.append(f"   sudo apt-get install python3-tk")
                     elif self.platform == 'Darwin':
-                        print(f"   Python from python.org includes tkinter")
+                        lines.append(f"   Python from python.org includes tkinter")
         
+        _write_lines(lines, out)
         return all_available
     
-    def check_nodejs(self) -> Tuple[bool, str]:
+    async def check_nodejs(self, out: Optional[TextIO] = None) -> Tuple[bool, str]:
         """Check if Node.js is installed"""
-        print("\n" + "=" * 60)
-        print("Node.js Environment Check")
-        print("=" * 60)
+        lines = [
+            "\n" + _RULE,
+            "Node.js Environment Check",
+            _RULE,
+        ]
+        result = await self._probe_nodejs(lines)
+        _write_lines(lines, out)
+        return result
+    
+    async def _probe_nodejs(self, lines: List[str]) -> Tuple[bool, str]:
+        """Look up Node.js and npm, appending the report to lines"""
+        # Resolve the binaries up front so a missing install needs no process
+        node_path = shutil.which('node')
+        if node_path is None:
+            lines.append("❌ Node.js not found!")
+            lines.append("\n📥 Install Node.js from: https://nodejs.org/")
+            lines.append("   Recommended: LTS (Long Term Support) version")
+            return False, ""
+        
+        if shutil.which('npm') is None:
+            lines.append("❌ npm not found")
+            return False, ""
+        
+        # Report the Node.js and npm versions from a single node process
+        version_script = (
+            'console.log(process.version);'
+            'try { console.log(require("child_process").execSync("npm --version").toString().trim()); }'
+            'catch (e) { console.log(""); }'
+        )
         
         try:
-            # Check Node.js
-            node_result = subprocess.run(
-                ['node', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            returncode, stdout, _ = await self._run([node_path, '-e', version_script],
+                                                    timeout=5, env=_NPM_ENV)
             
-            if node_result.returncode == 0:
-                node_version = node_result.stdout.strip()
-                print(f"✓ Node.js found: {node_version}")
-            else:
-                print("❌ Node.js not responding properly")
+            if returncode != 0:
+                lines.append("❌ Node.js not responding properly")
                 return False, ""
             
-            # Check npm
-            npm_result = subprocess.run(
-                ['npm', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            versions = stdout.splitlines()
+            node_version = versions[0].strip() if versions else ""
+            npm_version = versions[1].strip() if len(versions) > 1 else ""
+            parsed = _parse_version(node_version)
+            if parsed is None or parsed[0] < _MIN_NODE_MAJOR:
+                lines.append(f"❌ Node.js {node_version or '(unknown version)'} is too old")
+                lines.append(f"   Node.js {_MIN_NODE_MAJOR} or newer is required: https://nodejs.org/")
+                return False, ""
+            lines.append(f"✓ Node.js found: {node_version}")
             
-            if npm_result.returncode == 0:
-                npm_version = npm_result.stdout.strip()
-                print(f"✓ npm found: {npm_version}")
+            if npm_version:
+                lines.append(f"✓ npm found: {npm_version}")
                 return True, npm_version
             else:
-                print("❌ npm not found")
+                lines.append("❌ npm not found")
                 return False, ""
                 
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            print("❌ Node.js not found!")
-            print("\n📥 Install Node.js from: https://nodejs.org/")
-            print("   Recommended: LTS (Long Term Support) version")
+            lines.append("❌ Node.js not found!")
+            lines.append("\n📥 Install Node.js from: https://nodejs.org/")
+            lines.append("   Recommended: LTS (Long Term Support) version")
             return False, ""
     
-    def install_node_packages(self) -> bool:
+    async def install_node_packages(self) -> bool:
         """Install required Node.js packages"""
-        print("\n" + "=" * 60)
-        print("Installing Node.js Packages")
-        print("=" * 60)
-        
-        # Essential packages for Electron decompilation
-        packages = [
-            ('asar', 'ASAR archive packing/unpacking'),
-            ('electron-devtools-installer', 'Development tools installer'),
-            ('source-map-explorer', 'Source map analysis'),
-        ]
+        sys.stdout.write(f"\n{_DIV}Installing Node.js Packages\n{_DIV}")
+        
+        npm_path = shutil.which('npm')
+        if npm_path is None:
+            print("❌ npm not found")
+            return False
+        
+        package_names = [package_name for package_name, _ in NPM_PACKAGES]
+        
+        # Skip packages that are already installed at the latest version
+        latest, installed = await asyncio.gather(self.latest_versions(package_names),
+                                                 self.list_global_packages())
+        pending = [package_name for package_name in package_names
+                   if not installed.get(package_name)
+                   or installed[package_name] != latest.get(package_name)]
+        skipped = len(package_names) - len(pending)
+        
+        install_ok = True
+        if pending:
+            # Pin the registry's version so npm cannot settle for a stale
+            # cached one under --prefer-offline
+            specs = [f"{package_name}@{latest[package_name]}" if package_name in latest
+                     else package_name for package_name in pending]
+            install_ok = await self._install_packages(npm_path, specs)
+            # Report each package from what npm actually has installed
+            installed = await self.list_global_packages()
+        else:
+            print("\n✓ All packages are already at the latest version")
         
         success_count = 0
+        lines: List[str] = []
         
-        for package_name, description in packages:
-            print(f"\n📦 Installing {package_name}...")
-            print(f"   Description: {description}")
+        for package_name, description in NPM_PACKAGES:
+            if package_name in installed:
+                lines.append(f"   ✓ {package_name} {installed[package_name]} - {description}")
+                success_count += 1
+            else:
+                lines.append(f"   ❌ {package_name} is not installed")
+        
+        lines.append("\n" + _RULE)
+        lines.append(f"Installation Summary: {success_count}/{len(NPM_PACKAGES)} packages installed")
+        if skipped:
+            lines.append(f"Skipped {skipped} package(s) already at the latest version")
+        if not install_ok:
+            lines.append("⚠️  npm reported an error; some packages may be outdated")
+        lines.append(_RULE)
+        _write_lines(lines)
+        
+        return install_ok and success_count == len(NPM_PACKAGES)
+    
+    async def _install_packages(self, npm_path: str, package_specs: List[str]) -> bool:
+        """
+        Install the given packages globally, streaming npm's output
+        
+        Returns:
+            True if npm exited successfully, False otherwise
+        """
+        # Install everything in one npm run so dependencies resolve together
+        print(f"\n📦 Installing {', '.join(package_specs)}...")
+        
+        try:
+            returncode = await self.stream_command(
+                [npm_path, 'install', '-g', *package_specs, *_NPM_INSTALL_FLAGS],
+                timeout=300,
+                env=_NPM_ENV
+            )
             
-            try:
-                result = subprocess.run(
-                    ['npm', 'install', '-g', package_name],
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
+            if returncode is None:
+                print("   ❌ Installation timed out")
+            elif returncode != 0:
+                print("   ❌ npm install failed")
+            return returncode == 0
                 
-                if result.returncode == 0:
-                    print(f"   ✓ {package_name} installed successfully")
-                    success_count += 1
-                else:
-                    print(f"   ❌ Failed to install {package_name}")
-                    if result.stderr:
-                        print(f"   Error: {result.stderr[:200]}")
-                    
-            except subprocess.TimeoutExpired:
-                print(f"   ❌ Installation timed out for {package_name}")
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
-        
-        print(f"\n{'=' * 60}")
-        print(f"Installation Summary: {success_count}/{len(packages)} packages installed")
-        print("=" * 60)
-        
-        return success_count == len(packages)
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+            return False
+    
+    async def _run(self, cmd: List[str], timeout: float,
+                   env: Optional[Dict[str, str]] = None) -> Tuple[int, str, str]:
+        """
+        Run a command without blocking the event loop and capture its output
+        
+        Returns:
+            The exit code, stdout and stderr
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command ran longer than timeout seconds
+        """
+        proc = await self._spawn(cmd, asyncio.subprocess.PIPE, env)
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            await self._kill(proc)
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        except asyncio.CancelledError:
+            _kill_tree(proc)
+            raise
+        
+        return (proc.returncode,
+                stdout.decode(errors='replace'),
+                stderr.decode(errors='replace'))
+    
+    async def stream_command(self, cmd: List[str], timeout: float,
+                             env: Optional[Dict[str, str]] = None) -> Optional[int]:
+        """
+        Run a command, printing its combined output as it is produced
+        
+        Returns:
+            The exit code, or None if the command was killed after timeout seconds
+        """
+        proc = await self._spawn(cmd, asyncio.subprocess.STDOUT, env)
+        deadline = time.monotonic() + timeout
+        
+        try:
+            while True:
+                raw_line = await asyncio.wait_for(proc.stdout.readline(),
+                                                  deadline - time.monotonic())
+                if not raw_line:
+                    break
+                line = raw_line.decode(errors='replace').rstrip()
+                if line:
+                    print(f"   │ {line[:200]}")
+            
+            return await asyncio.wait_for(proc.wait(), max(deadline - time.monotonic(), 1))
+        except asyncio.TimeoutError:
+            await self._kill(proc)
+            return None
+        except asyncio.CancelledError:
+            _kill_tree(proc)
+            raise
+    
+    async def _spawn(self, cmd: List[str], stderr: int,
+                     env: Optional[Dict[str, str]]) -> asyncio.subprocess.Process:
+        """
+        Start a command with piped stdout in a session of its own
+        
+        A new session lets _kill_tree take down grandchildren too (npm run by
+        node, lifecycle scripts run by npm); they would otherwise keep the
+        pipes open and stall the wait after a timeout.
+        """
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=stderr,
+            env=env,
+            start_new_session=True  # Ignored on Windows, where taskkill /T is used
+        )
+    
+    async def _kill(self, proc: asyncio.subprocess.Process) -> None:
+        """Kill a timed-out command's process tree and reap it"""
+        _kill_tree(proc)
+        try:
+            await asyncio.wait_for(proc.wait(), 5)
+        except asyncio.TimeoutError:
+            pass  # Something outside the session still holds the pipes
+    
+    async def latest_versions(self, package_names: List[str]) -> Dict[str, str]:
+        """Return the latest published version of each package, where the registry answers"""
+        npm_path = shutil.which('npm')
+        if npm_path is None:
+            return {}
+        
+        async def view(package_name: str) -> str:
+            try:
+                returncode, stdout, _ = await self._run(
+                    [npm_path, 'view', package_name, 'version', '--json'],
+                    timeout=30, env=_NPM_ENV)
+                version = json.loads(stdout) if returncode == 0 else ''
+            except (subprocess.TimeoutExpired, OSError, ValueError):
+                return ''
+            return version if isinstance(version, str) else ''
+        
+        # npm view takes a single package spec, so query them side by side
+        versions = await asyncio.gather(*(view(package_name) for package_name in package_names))
+        return {package_name: version
+                for package_name, version in zip(package_names, versions) if version}
+    
+    async def list_global_packages(self) -> Dict[str, str]:
+        """Return globally installed npm packages mapped to their versions"""
+        npm_path = shutil.which('npm')
+        if npm_path is None:
+            return {}
+        
+        try:
+            _, stdout, _ = await self._run([npm_path, 'list', '-g', '--depth=0', '--json'],
+                                           timeout=60, env=_NPM_ENV)
+            # npm exits non-zero on tree problems but still prints the JSON
+            dependencies = json.loads(stdout or '{}').get('dependencies', {})
+        except (subprocess.TimeoutExpired, OSError, ValueError):
+            return {}
+        
+        return {name: info.get('version', '') for name, info in dependencies.items()}
     
-    def check_pip_packages(self) -> None:
+    def check_pip_packages(self, out: Optional[TextIO] = None) -> None:
         """Check if any optional pip packages would be useful"""
-        print("\n" + "=" * 60)
-        print("Optional Python Packages")
-        print("=" * 60)
-        
-        optional_packages = [
-            ('pillow', 'Image processing (if working with icons)'),
-            ('beautifulsoup4', 'HTML parsing (if analyzing HTML)'),
-            ('requests', 'HTTP requests (for downloading resources)'),
+        lines = [
+            "\n" + _RULE,
+            "Optional Python Packages",
+            _RULE,
+            "\nOptional packages that may enhance functionality:",
         ]
+        for package, import_name, description in OPTIONAL_PIP_PACKAGES:
+            # Locate the package without importing it; already imported ones are free
+            if import_name in sys.modules or find_spec(import_name) is not None:
+                lines.append(f"✓ {package:<20} - {description} [INSTALLED]")
+            else:
+                lines.append(f"○ {package:<20} - {description} [NOT INSTALLED]")
         
-        print("\nOptional packages that may enhance functionality:")
-        for package, description in optional_packages:
-            try:
-                __import__(package)
-                print(f"✓ {package:<20} - {description} [INSTALLED]")
-            except ImportError:
-                print(f"○ {package:<20} - {description} [NOT INSTALLED]")
+        lines.append("\nTo install optional packages:")
+        lines.append("python -m pip install " + " ".join(package for package, _, _ in OPTIONAL_PIP_PACKAGES))
         
-        print("\nTo install optional packages:")
-        print(f"python -m pip install pillow beautifulsoup4 requests")
+        _write_lines(lines, out)
     
-    def run_installation(self) -> bool:
+    async def run_installation(self) -> bool:
         """Run complete installation process"""
-        print("\n")
-        print("╔══════════════════════════════════════════════════════════╗")
-        print("║   Electron Decompiler - Requirements Installer          ║")
-        print("║   Python 3.13.7 Compatible                              ║")
-        print("╚══════════════════════════════════════════════════════════╝")
-        print()
+        sys.stdout.write(_BANNER)
+        
+        # Look up the registry while the environment probes run
+        threading.Thread(target=_prewarm_registry_dns, daemon=True).start()
         
         # Check Python version
         if not self.check_python_version():
             return False
         
-        # Verify built-in modules
-        if not self.verify_builtin_modules():
-            print("\n⚠️  Some built-in modules are missing.")
-            print("   Please install them before continuing.")
-            return False
+        # Reuse recent module and Node.js probe results for this environment
+        cache_key = _probe_cache_key()
+        cached = _load_probe_cache(cache_key)
         
-        # Check Node.js
-        nodejs_available, npm_version = self.check_nodejs()
-        if not nodejs_available:
-            return False
+        # Run the independent probes concurrently; each writes to its own
+        # buffer so the output is printed in the usual order
+        outputs = {name: io.StringIO() for name in ('modules', 'nodejs', 'pip')}
+        probes = {'pip': asyncio.to_thread(self.check_pip_packages, outputs['pip'])}
+        if cached is None:
+            probes['modules'] = asyncio.to_thread(self.verify_builtin_modules, outputs['modules'])
+            probes['nodejs'] = self.check_nodejs(outputs['nodejs'])
+        
+        results = dict(zip(probes, await asyncio.gather(*probes.values())))
+        
+        if cached is not None:
+            npm_version = cached.get('npm_version', '')
+            print(f"\n✓ Using cached environment probe (npm {npm_version})")
+        else:
+            # Verify built-in modules
+            sys.stdout.write(outputs['modules'].getvalue())
+            if not results['modules']:
+                print("\n⚠️  Some built-in modules are missing.")
+                print("   Please install them before continuing.")
+                return False
+            
+            # Check Node.js
+            sys.stdout.write(outputs['nodejs'].getvalue())
+            nodejs_available, npm_version = results['nodejs']
+            if not nodejs_available:
+                return False
+            
+            _save_probe_cache(cache_key, npm_version)
         
         # Install Node.js packages
         print("\n⚠️  This will install npm packages globally.")
-        response = input("Continue with npm package installation? (y/n): ")
+        if self.auto_yes or not sys.stdin.isatty():
+            print("Continuing with npm package installation (non-interactive)")
+            response = 'y'
+        else:
+            response = input("Continue with npm package installation? (y/n): ")
         
         if response.lower() != 'y':
             print("Installation cancelled by user.")
             return False
         
-        packages_installed = self.install_node_packages()
+        packages_installed = await self.install_node_packages()
         
         # Show optional packages
-        self.check_pip_packages()
+        sys.stdout.write(outputs['pip'].getvalue())
         
         # Final summary
-        print("\n" + "=" * 60)
-        print("Installation Complete!")
-        print("=" * 60)
+        sys.stdout.write(f"\n{_DIV}Installation Complete!\n{_DIV}")
         
         if packages_installed:
             print("✓ All required packages installed successfully")
@@ -240,12 +610,24 @@ class RequirementsInstaller:
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Install the Electron Decompiler requirements")
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help="install npm packages without asking and exit without waiting")
+    parser.add_argument('--non-interactive', action='store_true',
+                        help="never prompt for input (implies --yes)")
+    args = parser.parse_args()
+    
+    auto_yes = args.yes or args.non_interactive
+    # Only wait for Enter when someone is actually at the terminal
+    pause_on_exit = not auto_yes and sys.stdin.isatty() and sys.stdout.isatty()
+    
     try:
-        installer = RequirementsInstaller()
-        success = installer.run_installation()
+        installer = RequirementsInstaller(auto_yes=auto_yes)
+        success = asyncio.run(installer.run_installation())
         
-        print("\n" + "=" * 60)
-        input("Press Enter to exit...")
+        sys.stdout.write("\n" + _DIV)
+        if pause_on_exit:
+            input("Press Enter to exit...")
         
         sys.exit(0 if success else 1)
         
@@ -254,7 +636,8 @@ def main():
         sys.exit(1)
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
-        input("Press Enter to exit...")
+        if pause_on_exit:
+            input("Press Enter to exit...")
         sys.exit(1)
 
 